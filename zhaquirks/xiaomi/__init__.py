@@ -618,13 +618,11 @@ class AnalogInputCluster(CustomCluster, AnalogInput):
     and either on endpoint 1 or 2 for older devices.
     """
 
+    PRESENT_VALUE_ID = AnalogInput.AttributeDefs.present_value.id
+
     def _update_attribute(self, attrid, value):
         super()._update_attribute(attrid, value)
-        if (
-            attrid == self.AttributeDefs.present_value.id
-            and value is not None
-            and value >= 0
-        ):
+        if attrid == self.PRESENT_VALUE_ID and value is not None and value >= 0:
             # ElectricalMeasurementCluster is assumed to be on endpoint 1
             self.endpoint.device.endpoints[1].electrical_measurement.update_attribute(
                 ElectricalMeasurement.AttributeDefs.active_power.id,
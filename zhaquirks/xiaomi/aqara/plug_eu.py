@@ -76,273 +76,151 @@ class OppleCluster(XiaomiAqaraE1Cluster):
         return result
 
 
+_OUT_TIME_OTA = [Time.cluster_id, Ota.cluster_id]
+
+# <SimpleDescriptor endpoint=1 profile=260 device_type=81
+# device_version=1
+# input_clusters=[0, 2, 3, 4, 5, 6, 9, 1794, 2820]
+# output_clusters=[10, 25]>
+_EP1_SIG = {
+    PROFILE_ID: zha.PROFILE_ID,
+    DEVICE_TYPE: zha.DeviceType.SMART_PLUG,
+    INPUT_CLUSTERS: [
+        Basic.cluster_id,
+        DeviceTemperature.cluster_id,
+        Identify.cluster_id,
+        Groups.cluster_id,
+        Scenes.cluster_id,
+        OnOff.cluster_id,
+        Alarms.cluster_id,
+        Metering.cluster_id,
+        ElectricalMeasurement.cluster_id,
+    ],
+    OUTPUT_CLUSTERS: _OUT_TIME_OTA,
+}
+
+# <SimpleDescriptor endpoint=1 profile=260 device_type=81
+# device_version=1
+# input_clusters=[0, 2, 3, 4, 5, 6, 64704]
+# output_clusters=[10, 25]>
+_EP1_ALT_INPUTS = [
+    Basic.cluster_id,
+    DeviceTemperature.cluster_id,
+    Identify.cluster_id,
+    Groups.cluster_id,
+    Scenes.cluster_id,
+    OnOff.cluster_id,
+    OppleCluster.cluster_id,
+]
+_EP1_ALT = {
+    PROFILE_ID: zha.PROFILE_ID,
+    DEVICE_TYPE: zha.DeviceType.SMART_PLUG,
+    INPUT_CLUSTERS: _EP1_ALT_INPUTS,
+    OUTPUT_CLUSTERS: _OUT_TIME_OTA,
+}
+
+# <SimpleDescriptor endpoint=21 profile=260 device_type=81
+# device_version=1
+# input_clusters=[12]
+# output_clusters=[]>
+# Also seen on endpoints 22 and 31 depending on firmware.
+_EP_ANALOG = {
+    PROFILE_ID: zha.PROFILE_ID,
+    DEVICE_TYPE: zha.DeviceType.SMART_PLUG,
+    INPUT_CLUSTERS: [AnalogInput.cluster_id],
+}
+
+# <SimpleDescriptor endpoint=242 profile=41440 device_type=97
+# device_version=0
+# input_clusters=[]
+# output_clusters=[33]>
+_GP_ENDPOINT = {
+    PROFILE_ID: zgp.PROFILE_ID,
+    DEVICE_TYPE: zgp.DeviceType.PROXY_BASIC,
+    OUTPUT_CLUSTERS: [GreenPowerProxy.cluster_id],
+}
+
+_ENDPOINTS = {1: _EP1_SIG, 242: _GP_ENDPOINT}
+_ENDPOINTS_ALT1 = {1: _EP1_ALT, 21: _EP_ANALOG, 31: _EP_ANALOG, 242: _GP_ENDPOINT}
+_ENDPOINTS_ALT2 = {1: _EP1_ALT, 242: _GP_ENDPOINT}
+_ENDPOINTS_ALT3 = {1: _EP1_ALT, 21: _EP_ANALOG, 22: _EP_ANALOG, 242: _GP_ENDPOINT}
+
+_REPLACEMENT = {
+    ENDPOINTS: {
+        1: {
+            PROFILE_ID: zha.PROFILE_ID,
+            DEVICE_TYPE: zha.DeviceType.SMART_PLUG,
+            INPUT_CLUSTERS: [
+                BasicCluster,
+                DeviceTemperature.cluster_id,
+                Identify.cluster_id,
+                Groups.cluster_id,
+                Scenes.cluster_id,
+                OnOff.cluster_id,
+                Alarms.cluster_id,
+                MeteringCluster,
+                ElectricalMeasurementCluster,
+                OppleCluster,
+            ],
+            OUTPUT_CLUSTERS: _OUT_TIME_OTA,
+        },
+        21: {
+            PROFILE_ID: zha.PROFILE_ID,
+            DEVICE_TYPE: zha.DeviceType.SMART_PLUG,
+            INPUT_CLUSTERS: [AnalogInputCluster],
+        },
+        242: _GP_ENDPOINT,
+    },
+}
+
+_MODELS_MMEU01 = [(LUMI, "lumi.plug.mmeu01")]
+_MODELS_MAEU01 = [(LUMI, "lumi.plug.maeu01")]
+
+
 class PlugMMEU01(XiaomiCustomDevice):
     """lumi.plug.mmeu01 plug."""
 
-    signature = {
-        MODELS_INFO: [
-            (LUMI, "lumi.plug.mmeu01"),
-        ],
-        ENDPOINTS: {
-            # <SimpleDescriptor endpoint=1 profile=260 device_type=81
-            # device_version=1
-            # input_clusters=[0, 2, 3, 4, 5, 6, 9, 1794, 2820]
-            # output_clusters=[10, 25]>
-            1: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.SMART_PLUG,
-                INPUT_CLUSTERS: [
-                    Basic.cluster_id,
-                    DeviceTemperature.cluster_id,
-                    Identify.cluster_id,
-                    Groups.cluster_id,
-                    Scenes.cluster_id,
-                    OnOff.cluster_id,
-                    Alarms.cluster_id,
-                    Metering.cluster_id,
-                    ElectricalMeasurement.cluster_id,
-                ],
-                OUTPUT_CLUSTERS: [Time.cluster_id, Ota.cluster_id],
-            },
-            # <SimpleDescriptor endpoint=242 profile=41440 device_type=97
-            # device_version=0
-            # input_clusters=[]
-            # output_clusters=[33]>
-            242: {
-                PROFILE_ID: zgp.PROFILE_ID,
-                DEVICE_TYPE: zgp.DeviceType.PROXY_BASIC,
-                OUTPUT_CLUSTERS: [GreenPowerProxy.cluster_id],
-            },
-        },
-    }
-
-    replacement = {
-        ENDPOINTS: {
-            1: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.SMART_PLUG,
-                INPUT_CLUSTERS: [
-                    BasicCluster,
-                    DeviceTemperature.cluster_id,
-                    Identify.cluster_id,
-                    Groups.cluster_id,
-                    Scenes.cluster_id,
-                    OnOff.cluster_id,
-                    Alarms.cluster_id,
-                    MeteringCluster,
-                    ElectricalMeasurementCluster,
-                    OppleCluster,
-                ],
-                OUTPUT_CLUSTERS: [Time.cluster_id, Ota.cluster_id],
-            },
-            21: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.SMART_PLUG,
-                INPUT_CLUSTERS: [AnalogInputCluster],
-            },
-            242: {
-                PROFILE_ID: zgp.PROFILE_ID,
-                DEVICE_TYPE: zgp.DeviceType.PROXY_BASIC,
-                OUTPUT_CLUSTERS: [GreenPowerProxy.cluster_id],
-            },
-        },
-    }
+    signature = {MODELS_INFO: _MODELS_MMEU01, ENDPOINTS: _ENDPOINTS}
+    replacement = _REPLACEMENT
 
 
 class PlugMMEU01Alt1(PlugMMEU01):
     """lumi.plug.mmeu01 plug with alternative signature."""
 
-    signature = {
-        MODELS_INFO: PlugMMEU01.signature[MODELS_INFO],
-        ENDPOINTS: {
-            # <SimpleDescriptor endpoint=1 profile=260 device_type=81
-            # device_version=1
-            # input_clusters=[0, 2, 3, 4, 5, 6, 64704]
-            # output_clusters=[10, 25]>
-            1: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.SMART_PLUG,
-                INPUT_CLUSTERS: [
-                    Basic.cluster_id,
-                    DeviceTemperature.cluster_id,
-                    Identify.cluster_id,
-                    Groups.cluster_id,
-                    Scenes.cluster_id,
-                    OnOff.cluster_id,
-                    OppleCluster.cluster_id,
-                ],
-                OUTPUT_CLUSTERS: [Time.cluster_id, Ota.cluster_id],
-            },
-            # <SimpleDescriptor endpoint=21 profile=260 device_type=81
-            # device_version=1
-            # input_clusters=[12]
-            # output_clusters=[]>
-            21: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.SMART_PLUG,
-                INPUT_CLUSTERS: [AnalogInput.cluster_id],
-            },
-            # <SimpleDescriptor endpoint=31 profile=260 device_type=81
-            # device_version=1
-            # input_clusters=[12]
-            # output_clusters=[]>
-            31: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.SMART_PLUG,
-                INPUT_CLUSTERS: [AnalogInput.cluster_id],
-            },
-            # <SimpleDescriptor endpoint=242 profile=41440 device_type=97
-            # device_version=0
-            # input_clusters=[]
-            # output_clusters=[33]>
-            242: {
-                PROFILE_ID: zgp.PROFILE_ID,
-                DEVICE_TYPE: zgp.DeviceType.PROXY_BASIC,
-                OUTPUT_CLUSTERS: [GreenPowerProxy.cluster_id],
-            },
-        },
-    }
-
-    replacement = PlugMMEU01.replacement
+    signature = {MODELS_INFO: _MODELS_MMEU01, ENDPOINTS: _ENDPOINTS_ALT1}
 
 
 class PlugMMEU01Alt2(PlugMMEU01):
     """lumi.plug.mmeu01 plug with alternative signature."""
 
-    signature = {
-        MODELS_INFO: PlugMMEU01.signature[MODELS_INFO],
-        ENDPOINTS: {
-            # <SimpleDescriptor endpoint=1 profile=260 device_type=81
-            # device_version=1
-            # input_clusters=[0, 2, 3, 4, 5, 6, 64704]
-            # output_clusters=[10, 25]>
-            1: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.SMART_PLUG,
-                INPUT_CLUSTERS: [
-                    Basic.cluster_id,
-                    DeviceTemperature.cluster_id,
-                    Identify.cluster_id,
-                    Groups.cluster_id,
-                    Scenes.cluster_id,
-                    OnOff.cluster_id,
-                    OppleCluster.cluster_id,
-                ],
-                OUTPUT_CLUSTERS: [Time.cluster_id, Ota.cluster_id],
-            },
-            # <SimpleDescriptor endpoint=242 profile=41440 device_type=97
-            # device_version=0
-            # input_clusters=[]
-            # output_clusters=[33]>
-            242: {
-                PROFILE_ID: zgp.PROFILE_ID,
-                DEVICE_TYPE: zgp.DeviceType.PROXY_BASIC,
-                OUTPUT_CLUSTERS: [GreenPowerProxy.cluster_id],
-            },
-        },
-    }
-
-    replacement = PlugMMEU01.replacement
+    signature = {MODELS_INFO: _MODELS_MMEU01, ENDPOINTS: _ENDPOINTS_ALT2}
 
 
 class PlugMMEU01Alt3(PlugMMEU01):
     """lumi.plug.mmeu01 plug with alternative signature."""
 
-    signature = {
-        MODELS_INFO: PlugMMEU01.signature[MODELS_INFO],
-        ENDPOINTS: {
-            # <SimpleDescriptor endpoint=1 profile=260 device_type=81
-            # device_version=1
-            # input_clusters=[0, 2, 3, 4, 5, 6, 64704]
-            # output_clusters=[10, 25]>
-            1: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.SMART_PLUG,
-                INPUT_CLUSTERS: [
-                    Basic.cluster_id,
-                    DeviceTemperature.cluster_id,
-                    Identify.cluster_id,
-                    Groups.cluster_id,
-                    Scenes.cluster_id,
-                    OnOff.cluster_id,
-                    OppleCluster.cluster_id,
-                ],
-                OUTPUT_CLUSTERS: [Time.cluster_id, Ota.cluster_id],
-            },
-            # <SimpleDescriptor endpoint=21 profile=260 device_type=81
-            # device_version=1
-            # input_clusters=[12]
-            # output_clusters=[]>
-            21: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.SMART_PLUG,
-                INPUT_CLUSTERS: [AnalogInput.cluster_id],
-            },
-            # <SimpleDescriptor endpoint=22 profile=260 device_type=81
-            # device_version=1
-            # input_clusters=[12]
-            # output_clusters=[]>
-            22: {
-                PROFILE_ID: zha.PROFILE_ID,
-                DEVICE_TYPE: zha.DeviceType.SMART_PLUG,
-                INPUT_CLUSTERS: [AnalogInput.cluster_id],
-            },
-            # <SimpleDescriptor endpoint=242 profile=41440 device_type=97
-            # device_version=0
-            # input_clusters=[]
-            # output_clusters=[33]>
-            242: {
-                PROFILE_ID: zgp.PROFILE_ID,
-                DEVICE_TYPE: zgp.DeviceType.PROXY_BASIC,
-                OUTPUT_CLUSTERS: [GreenPowerProxy.cluster_id],
-            },
-        },
-    }
-
-    replacement = PlugMMEU01.replacement
+    signature = {MODELS_INFO: _MODELS_MMEU01, ENDPOINTS: _ENDPOINTS_ALT3}
 
 
 class PlugMAEU01(PlugMMEU01):
     """lumi.plug.maeu01 plug."""
 
-    signature = {
-        MODELS_INFO: [
-            (LUMI, "lumi.plug.maeu01"),
-        ],
-        ENDPOINTS: PlugMMEU01.signature[ENDPOINTS],
-    }
-
-    replacement = PlugMMEU01.replacement
+    signature = {MODELS_INFO: _MODELS_MAEU01, ENDPOINTS: _ENDPOINTS}
 
 
 class PlugMAEU01Alt1(PlugMAEU01):
     """lumi.plug.maeu01 plug with alternative signature."""
 
-    signature = {
-        MODELS_INFO: PlugMAEU01.signature[MODELS_INFO],
-        ENDPOINTS: PlugMMEU01Alt1.signature[ENDPOINTS],
-    }
-
-    replacement = PlugMAEU01.replacement
+    signature = {MODELS_INFO: _MODELS_MAEU01, ENDPOINTS: _ENDPOINTS_ALT1}
 
 
 class PlugMAEU01Alt2(PlugMAEU01):
     """lumi.plug.maeu01 plug with alternative signature."""
 
-    signature = {
-        MODELS_INFO: PlugMAEU01.signature[MODELS_INFO],
-        ENDPOINTS: PlugMMEU01Alt2.signature[ENDPOINTS],
-    }
-
-    replacement = PlugMAEU01.replacement
+    signature = {MODELS_INFO: _MODELS_MAEU01, ENDPOINTS: _ENDPOINTS_ALT2}
 
 
 class PlugMAEU01Alt3(PlugMAEU01):
     """lumi.plug.maeu01 plug with alternative signature."""
 
-    signature = {
-        MODELS_INFO: PlugMAEU01.signature[MODELS_INFO],
-        ENDPOINTS: PlugMMEU01Alt3.signature[ENDPOINTS],
-    }
-
-    replacement = PlugMAEU01.replacement
+    signature = {MODELS_INFO: _MODELS_MAEU01, ENDPOINTS: _ENDPOINTS_ALT3}